@@ -8,14 +8,18 @@ class BookRecommendationAgent:
         self.prompt_template = llm_provider.create_prompt_template()
 
     def ask(self, question: str, k: int = 5):
+        return "".join(self.stream(question, k=k))
+
+    def stream(self, question: str, k: int = 5):
         # Search for similar books
         similar_books = self.rag_system.get_similar_books(question, k=k)
 
         if not similar_books:
-            return "I couldn't find any books matching your query. Please try with different keywords."
+            yield "I couldn't find any books matching your query. Please try with different keywords."
+            return
 
         # Generate response
         prompt = self.prompt_template.format(books_list=similar_books, question=question)
-        response = self.llm_provider.llm.invoke(prompt)
-
-        return response.content
+        for chunk in self.llm_provider.llm.stream(prompt):
+            if chunk.content:
+                yield chunk.content
@@ -9,7 +9,7 @@ from fastapi.responses import HTMLResponse
 from rag import RAGSystem
 from llm import LLMProvider
 from agent import BookRecommendationAgent
-from guardrails import SecurityGuardrails
+from guardrails import SecurityGuardrails, safe_output
 
 # --------------------------------------------------
 # Environment & logging
@@ -105,7 +105,7 @@ def ask_question(request: QuestionRequest):
         )
 
     try:
-        answer = state.agent.ask(question)
+        answer = "".join(safe_output(state.agent.stream(question), guardrails))
         return QuestionResponse(answer=answer)
 
     except Exception:
@@ -48,6 +48,11 @@ pii_patterns = {
             "credit_card": r"\b(?:\d[ -]*?){13,16}\b",
         }
 
+# Output scanning: characters held back while streaming so PII spanning
+# chunk boundaries is caught (must exceed the longest expected PII match)
+output_scan_window = 128
+output_pii_action = "redact"  # "redact" or "block"
+
 
 invalid_intents = ["credentials", "personal_data", "database_extraction", "danger"]
 valid_intents = ["book_recommendation", "livro", "author", "autor", "isbn",
@@ -1,7 +1,10 @@
 import re
+import logging
 import config
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -16,6 +19,10 @@ class SecurityGuardrails:
         
         self.intent_keywords = config.keywords
         self.pii_patterns = config.pii_patterns
+        self.compiled_pii_patterns = {
+            pii_type: re.compile(pattern)
+            for pii_type, pattern in self.pii_patterns.items()
+        }
     
     # ---------- Input validation ---------
     def check_user_input(self, text: str) -> GuardrailResult:
@@ -64,22 +71,66 @@ class SecurityGuardrails:
 
     # ---------- Output validation ---------
     def check_model_output(self, text: str) -> GuardrailResult:
-        text_lower = text.lower()
+        scanner = self.output_scanner(action="block")
+        scanner.feed(text)
+        scanner.finish()
+        return scanner.result()
 
-        # Prevent PII leakage
-        for pii_type, pattern in self.pii_patterns.items():
-            if re.search(pattern, text):
-                return GuardrailResult(
-                    allowed=False,
-                    intent="pii_leakage",
-                    reason=f"Sensitive data leakage: {pii_type}",
-                )
+    def output_scanner(self, action: Optional[str] = None) -> "OutputScanner":
+        return OutputScanner(self, action=action or config.output_pii_action)
+
+
+class OutputScanner:
+    """
+    Output validation for streamed answers (`check_model_output` runs it
+    over a complete text).
 
-        # Basic domain check
-        if not any(
-            kw in text_lower
-            for kw in config.valid_intents
-        ):
+    Text is released only once it is more than `window` characters behind
+    the end of the stream, so a PII match spanning chunk boundaries is seen
+    whole before any part of it is emitted. A scan only runs once twice the
+    window is pending and releases at least `window` characters, which keeps
+    the cost linear in the output length regardless of chunk size.
+    """
+
+    def __init__(self, guardrails: SecurityGuardrails, action: str = "redact",
+                 window: int = config.output_scan_window):
+        if action not in ("redact", "block"):
+            raise ValueError(f"Unknown output PII action: {action}")
+
+        self.patterns = guardrails.compiled_pii_patterns
+        self.action = action
+        self.window = window
+
+        self._buffer = ""
+        self._context = 0  # leading chars of the buffer already emitted
+        self._in_domain = False
+        self._leak: Optional[str] = None
+        self.blocked = False
+
+    # ---------- Streaming ---------
+    def feed(self, chunk: str) -> str:
+        if self.blocked or not chunk:
+            return ""
+
+        self._buffer += chunk
+        if len(self._buffer) - self._context < 2 * self.window:
+            return ""
+        return self._scan(len(self._buffer) - self.window)
+
+    def finish(self) -> str:
+        if self.blocked:
+            return ""
+        return self._scan(len(self._buffer))
+
+    def result(self) -> GuardrailResult:
+        if self._leak is not None:
+            return GuardrailResult(
+                allowed=False,
+                intent="pii_leakage",
+                reason=f"Sensitive data leakage: {self._leak}",
+            )
+
+        if not self._in_domain:
             return GuardrailResult(
                 allowed=False,
                 intent="scope_violation",
@@ -92,10 +143,76 @@ class SecurityGuardrails:
             reason="Safe model output",
         )
 
+    def _scan(self, cut: int) -> str:
+        buffer = self._buffer
+
+        if not self._in_domain:
+            buffer_lower = buffer.lower()
+            self._in_domain = any(kw in buffer_lower for kw in config.valid_intents)
+
+        # Start past the emitted context: it only anchors word boundaries,
+        # and every position before it was already tried by the last scan
+        matches = sorted(
+            (match.start(), match.end(), pii_type)
+            for pii_type, pattern in self.patterns.items()
+            for match in pattern.finditer(buffer, self._context)
+        )
+
+        pieces = []
+        pos = self._context
+        for start, end, pii_type in matches:
+            if start >= cut:
+                break
+
+            if self._leak is None:
+                self._leak = pii_type
+            if self.action == "block":
+                self.blocked = True
+                self._buffer = ""
+                return ""
+
+            if end <= pos:
+                continue
+            if start >= pos:
+                pieces.append(buffer[pos:start])
+                pieces.append(f"[REDACTED {pii_type}]")
+            pos = end
+            cut = max(cut, end)
+
+        pieces.append(buffer[pos:cut])
+
+        # Keep one emitted char so word boundaries still anchor the next scan
+        keep_from = max(cut - 1, 0)
+        self._buffer = buffer[keep_from:]
+        self._context = cut - keep_from
+        return "".join(pieces)
+
 
 def safe_question(msg, guardrails):
     result = guardrails.check_user_input(msg)
     if not result.allowed:
         print(f"Repeat your question, please = {result.intent} | reason = {result.reason}")
         return None
-    return result.allowed
\ No newline at end of file
+    return result.allowed
+
+
+def safe_output(chunks: Iterable[str], guardrails: SecurityGuardrails) -> Iterator[str]:
+    scanner = guardrails.output_scanner()
+    for chunk in chunks:
+        text = scanner.feed(chunk)
+        if text:
+            yield text
+        if scanner.blocked:
+            break
+
+    text = scanner.finish()
+    if text:
+        yield text
+
+    result = scanner.result()
+    if scanner.blocked:
+        yield "\n⚠️ Response interrupted: sensitive data detected."
+    if result.intent == "pii_leakage":
+        logger.warning(f"Model output flagged = {result.intent} | reason = {result.reason}")
+    elif not result.allowed:
+        logger.debug(f"Model output flagged = {result.intent} | reason = {result.reason}")
@@ -6,7 +6,7 @@ from dotenv import load_dotenv
 from rag import RAGSystem
 from llm import LLMProvider
 from agent import BookRecommendationAgent
-from guardrails import SecurityGuardrails
+from guardrails import SecurityGuardrails, safe_output
 
 guardrails = SecurityGuardrails()
 logging.basicConfig(level=logging.INFO)
@@ -38,9 +38,10 @@ def run_cli(agent: BookRecommendationAgent):
     question = input(">>> ")
     result = guardrails.check_user_input(question)
     if result.allowed:
-        answer = agent.ask(question)
         print("\nAnswer:")
-        print(answer)
+        for text in safe_output(agent.stream(question), guardrails):
+            print(text, end="", flush=True)
+        print()
 
 if __name__ == "__main__":
     logger.info("📚 Book Recommendation CLI")
@@ -0,0 +1,58 @@
+"""
+Latency added by the streamed output guardrail.
+
+Run from the book-recommender directory:
+    python benchmarks/output_scanner.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from guardrails import SecurityGuardrails  # noqa: E402
+
+WORDS = ("the author wrote a novel about dragons and it is rated highly "
+         "among readers of fantasy books").split()
+RUNS = 300
+
+
+def make_answer(n_chars, rng):
+    words = []
+    while sum(len(w) + 1 for w in words) < n_chars:
+        words.append(rng.choice(WORDS))
+    return " ".join(words)[:n_chars]
+
+
+def time_per_run(fn):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        fn()
+    return (time.perf_counter() - start) / RUNS * 1000
+
+
+def stream(guardrails, chunks):
+    scanner = guardrails.output_scanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+    scanner.finish()
+    return scanner.result()
+
+
+def main():
+    rng = random.Random(0)
+    guardrails = SecurityGuardrails()
+
+    print(f"{'chars':>7} {'chunk':>6} {'scanner ms':>11} {'one-shot ms':>13}")
+    for n_chars in (2_000, 8_000, 32_000):
+        answer = make_answer(n_chars, rng)
+        for size in (4, 20, 80):
+            chunks = [answer[i:i + size] for i in range(0, len(answer), size)]
+            streamed = time_per_run(lambda: stream(guardrails, chunks))
+            full = time_per_run(lambda: guardrails.check_model_output(answer))
+            print(f"{n_chars:>7} {size:>6} {streamed:>11.3f} {full:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
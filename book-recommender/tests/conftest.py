@@ -0,0 +1,5 @@
+import os
+import sys
+
+# App modules import each other as top-level modules (see PYTHONPATH in Dockerfile)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from guardrails import SecurityGuardrails
+
+PII = ["123.456.789-09", "john.doe@example.com", "AIza" + "A" * 35, "4111 1111 1111 1111"]
+TOKENS = ["1111", "1984", "4111", "-", "book", "author", "the", *PII]
+
+
+@pytest.fixture(scope="module")
+def guardrails():
+    return SecurityGuardrails()
+
+
+def full_text_redact(text, guardrails):
+    matches = sorted(
+        (match.start(), match.end(), pii_type)
+        for pii_type, pattern in guardrails.compiled_pii_patterns.items()
+        for match in pattern.finditer(text)
+    )
+    pieces, pos = [], 0
+    for start, end, pii_type in matches:
+        if end <= pos:
+            continue
+        if start >= pos:
+            pieces += [text[pos:start], f"[REDACTED {pii_type}]"]
+        pos = end
+    return "".join(pieces) + text[pos:]
+
+
+def stream(text, guardrails, action, rng):
+    scanner = guardrails.output_scanner(action)
+    output, pos = [], 0
+    while pos < len(text):
+        size = rng.randint(1, 160)
+        output.append(scanner.feed(text[pos:pos + size]))
+        pos += size
+    output.append(scanner.finish())
+    return "".join(output), scanner
+
+
+def random_text(rng):
+    return "".join(
+        rng.choice(TOKENS) + rng.choice("  ,\n")
+        for _ in range(rng.randint(1, 200))
+    )
+
+
+def test_streamed_redaction_matches_full_text(guardrails):
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = random_text(rng)
+        output, scanner = stream(text, guardrails, "redact", rng)
+
+        assert output == full_text_redact(text, guardrails)
+        assert scanner.result() == guardrails.check_model_output(text)
+
+
+def test_streamed_block_never_emits_pii(guardrails):
+    rng = random.Random(1)
+    for _ in range(2000):
+        text = random_text(rng)
+        output, scanner = stream(text, guardrails, "block", rng)
+        redacted = full_text_redact(text, guardrails)
+
+        if redacted == text:
+            assert not scanner.blocked
+            assert output == text
+        else:
+            assert scanner.blocked
+            assert text.startswith(output)
+            assert len(output) <= redacted.index("[REDACTED")
+
+
+def test_pii_split_across_chunks_is_redacted(guardrails):
+    scanner = guardrails.output_scanner("redact")
+    chunks = ["Ask the author at john.", "doe@exam", "ple.com for details."]
+    output = "".join(scanner.feed(chunk) for chunk in chunks) + scanner.finish()
+
+    assert output == "Ask the author at [REDACTED email] for details."
+    assert scanner.result().intent == "pii_leakage"